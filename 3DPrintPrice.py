@@ -1,51 +1,285 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import hashlib
 import json
+import math
 import os
+import queue
+import re
+import threading
+from dataclasses import dataclass, field
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Default config setup
 DEFAULT_CONFIG_DIR = "3d-print-price-config"
 CONFIG_FILE = "config.json"
 
-class PrinterProfile:
-    def __init__(self, name, power=0.0, amortization=0.0):
-        self.name = name
-        self.power = power
-        self.amortization = amortization
+# Well-known locations, resolved once at startup
+_HOME = os.path.expanduser("~")
+_DOCS = os.path.join(_HOME, "Documents")
+_DESK = os.path.join(_HOME, "Desktop")
+_CWD = os.getcwd()
+
+# JSON (de)serialization: use orjson when available, stdlib json otherwise.
+# Both work on bytes so config files are always opened in binary mode.
+# The app's own config is written compact; exports are indented for people.
+# Neither backend writes NaN/Infinity (numbers are checked on the way in), and
+# both read the Infinity/NaN tokens older versions could write.
+if orjson is not None:
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the stdlib accepts
+            return json.loads(data)
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_pretty(obj):
+        return json.dumps(obj, ensure_ascii=False, allow_nan=False, indent=4).encode("utf-8")
+
+# Lets users type decimal commas in numeric fields
+_COMMA_TO_DOT = str.maketrans(",", ".")
+
+def _finite_float(value):
+    """float(value), raising ValueError for None, infinities and NaN"""
+    try:
+        f = float(value)
+    except TypeError:
+        raise ValueError(f"not a number: {value!r}") from None
+    if not math.isfinite(f):
+        raise ValueError(f"not a finite number: {value!r}")
+    return f
+
+def _to_float(s):
+    """Parse a numeric entry value, accepting a decimal comma; raises ValueError"""
+    s = s.strip()
+    return _finite_float(s.translate(_COMMA_TO_DOT) if "," in s else s)
+
+# Numbers as they look while being typed: "", "-", "1,", "2.5e" all pass
+_PARTIAL_NUMBER_RE = re.compile(r"\s*[+-]?\d*(?:[.,]\d*)?(?:[eE][+-]?\d*)?\s*")
+
+def _is_numeric(s):
+    """Entry validatecommand: accept (partial) numbers with either decimal separator"""
+    return _PARTIAL_NUMBER_RE.fullmatch(s) is not None
+
+def _digest(payload):
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+# path -> (st_mtime_ns, st_size, parsed data, digest of the raw bytes)
+_JSON_CACHE = {}
+
+def _load_json_cached(path):
+    """Parse a JSON file, reusing the previous result while the file is unchanged.
+
+    Returns (data, digest). The data is shared between callers and must not
+    be modified.
+    """
+    st = os.stat(path)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2], cached[3]
+    with open(path, "rb") as f:
+        raw = f.read()
+    data = _loads(raw)
+    digest = _digest(raw)
+    _JSON_CACHE[path] = (st.st_mtime_ns, st.st_size, data, digest)
+    return data, digest
+
+def _atomic_write_bytes(path, payload):
+    """Write payload to a temp file next to path, then rename it over path.
+
+    The payload normally goes out in a single os.write call and is flushed to
+    disk before the rename, so after a crash or power loss path holds either
+    the old or the new contents. The temp file is removed if anything fails.
+    """
+    tmp_path = path + ".tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
 
-    def to_dict(self):
-        return {
+@dataclass(slots=True, frozen=True)
+class PrinterProfile:
+    name: str
+    power: float = 0.0
+    amortization: float = 0.0
+    _dict: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Frozen, so the serialized form can be built once; edits replace
+        # the whole object
+        object.__setattr__(self, "_dict", {
             "name": self.name,
             "power": self.power,
             "amortization": self.amortization
-        }
+        })
+
+    def to_dict(self):
+        return self._dict
 
     @staticmethod
     def from_dict(d):
         return PrinterProfile(
-            d.get("name", ""),
-            float(d.get("power", 0.0)),
-            float(d.get("amortization", 0.0))
+            str(d.get("name", "")),
+            _finite_float(d.get("power", 0.0)),
+            _finite_float(d.get("amortization", 0.0))
         )
 
+@dataclass(slots=True, frozen=True)
 class PlasticProfile:
-    def __init__(self, name, plastic_cost=0.0):
-        self.name = name
-        self.plastic_cost = plastic_cost
+    name: str
+    plastic_cost: float = 0.0
+    _dict: dict = field(init=False, repr=False, compare=False)
 
-    def to_dict(self):
-        return {
+    def __post_init__(self):
+        # See PrinterProfile: built once, the profile is frozen
+        object.__setattr__(self, "_dict", {
             "name": self.name,
             "plastic_cost": self.plastic_cost
-        }
+        })
+
+    def to_dict(self):
+        return self._dict
 
     @staticmethod
     def from_dict(d):
         return PlasticProfile(
-            d.get("name", ""),
-            float(d.get("plastic_cost", 0.0))
+            str(d.get("name", "")),
+            _finite_float(d.get("plastic_cost", 0.0))
         )
 
+class ProfileList:
+    """Ordered list of profiles indexed by name.
+
+    The names are kept in a parallel list, updated with every change,
+    which feeds the combobox directly. Behaves like a list of profiles for
+    indexing, assignment, deletion, append and iteration; `name in profiles`
+    tests for a name. `factory` turns raw dicts passed to new_profiles()
+    into profiles.
+    """
+
+    def __init__(self, factory, items=()):
+        self._factory = factory
+        self._items = list(items)
+        self._names = [item.name for item in self._items]
+        # name -> position of its first profile; rebuilt after deletes shift
+        # positions, updated in place otherwise
+        self._index = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, idx):
+        return self._items[idx]
+
+    def __setitem__(self, idx, profile):
+        if idx < 0:
+            idx += len(self._items)
+        old_name = self._names[idx]
+        self._items[idx] = profile
+        self._names[idx] = profile.name
+        index = self._index
+        if index is None or old_name == profile.name:
+            return
+        # Positions don't shift, so only the two names' entries can change
+        if index.get(old_name) == idx:
+            try:
+                index[old_name] = self._names.index(old_name, idx + 1)
+            except ValueError:
+                del index[old_name]
+        pos = index.get(profile.name)
+        if pos is None or pos > idx:
+            index[profile.name] = idx
+
+    def __delitem__(self, idx):
+        del self._items[idx]
+        del self._names[idx]
+        self._index = None
+
+    def __contains__(self, name):
+        return name in self._name_index()
+
+    def append(self, profile):
+        self._items.append(profile)
+        self._names.append(profile.name)
+        if self._index is not None:
+            self._index.setdefault(profile.name, len(self._items) - 1)
+
+    def new_profiles(self, profiles):
+        """Profiles whose names aren't in the list yet, without adding them.
+
+        Raw dicts are accepted too; only the new ones are turned into
+        profiles. Nameless entries and repeats of a name are skipped. Raises
+        if an entry can't be built, before anything has been added.
+        """
+        index = self._name_index()
+        factory = self._factory
+        new = {}
+        for p in profiles:
+            if isinstance(p, dict):
+                name = str(p.get("name", ""))
+                if not name or name in index or name in new:
+                    continue
+                p = factory(p)
+            elif not p.name or p.name in index or p.name in new:
+                continue
+            new[p.name] = p
+        return list(new.values())
+
+    def extend(self, profiles):
+        for p in profiles:
+            self.append(p)
+
+    @property
+    def names(self):
+        """Profile names in list order; treat as read-only"""
+        return self._names
+
+    def index(self, name, default=0):
+        """Position of the first profile with this name, or default"""
+        return self._name_index().get(name, default)
+
+    def to_dicts(self):
+        return [item.to_dict() for item in self._items]
+
+    def _name_index(self):
+        if self._index is None:
+            self._index = {}
+            for i, n in enumerate(self._names):
+                self._index.setdefault(n, i)
+        return self._index
+
 class Settings:
     def __init__(self):
         self.electricity_cost_default = 0.0
@@ -54,20 +288,33 @@ class Settings:
         self.last_selected_plastic = ""
         self.config_dir = self._get_config_directory()
         self.config_file_path = os.path.join(self.config_dir, CONFIG_FILE)
+        # Last parsed/written config contents, reused by load_profiles()
+        self._cached_data = None
+        # Digest of the config bytes last read or written, to skip no-op saves
+        self._last_saved_hash = None
+
+    @property
+    def margin_default(self):
+        return self._margin_default
+
+    @margin_default.setter
+    def margin_default(self, value):
+        self._margin_default = value
+        # Price factor used by every calculation, kept in sync with the margin
+        self.margin_multiplier = 1 + value / 100.0
 
     def _get_config_directory(self):
         """Get the configuration directory, preferring Documents folder"""
         # Try Documents folder first
         try:
-            documents_path = os.path.expanduser("~/Documents")
-            if os.path.exists(documents_path) and os.access(documents_path, os.W_OK):
-                config_dir = os.path.join(documents_path, DEFAULT_CONFIG_DIR)
+            if os.path.exists(_DOCS) and os.access(_DOCS, os.W_OK):
+                config_dir = os.path.join(_DOCS, DEFAULT_CONFIG_DIR)
                 return config_dir
         except Exception:
             pass
         
         # Fallback to current working directory if Documents is not accessible
-        config_dir = os.path.join(os.getcwd(), DEFAULT_CONFIG_DIR)
+        config_dir = os.path.join(_CWD, DEFAULT_CONFIG_DIR)
         return config_dir
 
     def ensure_config_dir_exists(self):
@@ -86,133 +333,225 @@ class Settings:
             # Current config path (Documents or current dir)
             self.config_file_path,
             # Documents location (in case current detection failed)
-            os.path.join(os.path.expanduser("~/Documents"), DEFAULT_CONFIG_DIR, CONFIG_FILE),
+            os.path.join(_DOCS, DEFAULT_CONFIG_DIR, CONFIG_FILE),
             # Current directory location
-            os.path.join(os.getcwd(), DEFAULT_CONFIG_DIR, CONFIG_FILE),
+            os.path.join(_CWD, DEFAULT_CONFIG_DIR, CONFIG_FILE),
             # Desktop location (legacy)
-            os.path.join(os.path.expanduser("~/Desktop"), DEFAULT_CONFIG_DIR, CONFIG_FILE),
+            os.path.join(_DESK, DEFAULT_CONFIG_DIR, CONFIG_FILE),
             # User home directory (legacy)
-            os.path.join(os.path.expanduser("~"), DEFAULT_CONFIG_DIR, CONFIG_FILE),
+            os.path.join(_HOME, DEFAULT_CONFIG_DIR, CONFIG_FILE),
         ]
         
-        for config_path in search_paths:
-            if os.path.exists(config_path):
-                # Found existing config, update our paths to match
-                self.config_dir = os.path.dirname(config_path)
-                self.config_file_path = config_path
-                return True
-        return False
+        # The current path usually equals one of the fixed ones; stat each only once
+        search_paths = dict.fromkeys(search_paths)
+        config_path = next((p for p in search_paths if os.path.isfile(p)), None)
+        if config_path is None:
+            return False
+        # Found existing config, update our paths to match
+        self.config_dir = os.path.dirname(config_path)
+        self.config_file_path = config_path
+        return True
 
     def load(self):
         # First try to find existing config
         config_found = self.find_existing_config()
         
-        if config_found and os.path.exists(self.config_file_path):
+        if not config_found:
+            return False
+        try:
+            data, digest = _load_json_cached(self.config_file_path)
+            self._cached_data = data
+            self._last_saved_hash = digest
+            self.last_selected_printer = data.get("last_selected_printer", "")
+            self.last_selected_plastic = data.get("last_selected_plastic", "")
+        except FileNotFoundError:
+            # Removed since find_existing_config() saw it
+            return False
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load settings:\n{e}")
+            return False
+        # Each value on its own, so one bad setting doesn't discard the other.
+        # The config still counts as found so its profiles aren't overwritten.
+        errors = []
+        for key in ("electricity_cost_default", "margin_default"):
             try:
-                with open(self.config_file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.electricity_cost_default = float(data.get("electricity_cost_default", 0.0))
-                    self.margin_default = float(data.get("margin_default", 0.0))
-                    self.last_selected_printer = data.get("last_selected_printer", "")
-                    self.last_selected_plastic = data.get("last_selected_plastic", "")
-                return True
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load settings:\n{e}")
-                return False
-        return False
+                setattr(self, key, _finite_float(data.get(key, 0.0)))
+            except ValueError as e:
+                errors.append(f"{key}: {e}")
+        if errors:
+            messagebox.showerror("Error", "Invalid default settings, using 0 instead:\n" + "\n".join(errors))
+        return True
 
     def save(self, printers=None, plastics=None):
         try:
             if not self.ensure_config_dir_exists():
                 return
-            
-            data = {
-                "electricity_cost_default": self.electricity_cost_default,
-                "margin_default": self.margin_default,
-                "last_selected_printer": self.last_selected_printer,
-                "last_selected_plastic": self.last_selected_plastic,
-                "printers": [p.to_dict() for p in (printers or [])],
-                "plastics": [p.to_dict() for p in (plastics or [])]
-            }
-            with open(self.config_file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            self.write(self.build_data(printers, plastics))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration:\n{e}")
 
+    def build_data(self, printers=None, plastics=None):
+        """Snapshot settings and profiles (ProfileLists) into the dict that gets saved"""
+        data = {
+            "electricity_cost_default": self.electricity_cost_default,
+            "margin_default": self.margin_default,
+            "last_selected_printer": self.last_selected_printer,
+            "last_selected_plastic": self.last_selected_plastic,
+            "printers": printers.to_dicts() if printers else [],
+            "plastics": plastics.to_dicts() if plastics else []
+        }
+        self._cached_data = data
+        return data
+
+    def write(self, data):
+        """Write a config snapshot to disk, raising on failure.
+
+        Doesn't touch Tk, so it is safe to call from a background thread.
+        """
+        payload = _dumps(data)
+        digest = _digest(payload)
+        if digest == self._last_saved_hash and os.path.isfile(self.config_file_path):
+            return
+        os.makedirs(self.config_dir, exist_ok=True)
+        _atomic_write_bytes(self.config_file_path, payload)
+        self._last_saved_hash = digest
+
     def load_profiles(self):
-        """Load printer and plastic profiles from config file"""
+        """Load printer and plastic profiles from config file.
+
+        Entries that can't be read are skipped and reported, so one bad
+        profile doesn't hide the others.
+        """
         printers = []
         plastics = []
-        if os.path.exists(self.config_file_path):
-            try:
-                with open(self.config_file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    printers = [PrinterProfile.from_dict(d) for d in data.get("printers", [])]
-                    plastics = [PlasticProfile.from_dict(d) for d in data.get("plastics", [])]
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load profiles:\n{e}")
+        errors = []
+        data = self._cached_data
+        try:
+            if data is None:
+                data, _ = _load_json_cached(self.config_file_path)
+                self._cached_data = data
+            for key, factory, profiles in (
+                ("printers", PrinterProfile.from_dict, printers),
+                ("plastics", PlasticProfile.from_dict, plastics),
+            ):
+                for i, d in enumerate(data.get(key, [])):
+                    try:
+                        profiles.append(factory(d))
+                    except (AttributeError, TypeError, ValueError) as e:
+                        errors.append(f"{key}[{i}]: {e}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load profiles:\n{e}")
+        if errors:
+            messagebox.showerror("Error", "Skipped invalid profiles:\n" + "\n".join(errors))
         return printers, plastics
 
 class CenteredToplevel(tk.Toplevel):
-    def __init__(self, master=None, **kwargs):
+    """Modal dialog centered over its master.
+
+    Closing only hides the window, so the same dialog can be shown again
+    with show() instead of rebuilding its widgets every time.
+    """
+
+    def __init__(self, master=None, width=None, height=None, **kwargs):
         super().__init__(master, **kwargs)
         self.withdraw()
+        self._size = (width, height)
+        if width is not None and height is not None:
+            self.geometry(f"{width}x{height}")
         self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self._closed = tk.BooleanVar(self, value=True)
+        # Don't leave show() waiting if the dialog goes away with the app
+        self.bind("<Destroy>", self._on_destroy, add="+")
+
+    def show(self):
+        """Show the dialog and wait until it is closed"""
+        self._closed.set(False)
+        self._center_and_show()
+        self.wait_visibility()
         self.grab_set()
-        self.after(0, self._center_and_show)
+        self.wait_variable(self._closed)
+
+    def close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._closed.set(True)
 
     def _center_and_show(self):
-        self.update_idletasks()
+        win_width, win_height = self._size
+        if win_width is None or win_height is None:
+            # Size not known up front, let Tk work it out
+            self.update_idletasks()
+            win_width = self.winfo_width()
+            win_height = self.winfo_height()
         if self.master is not None:
             master_x = self.master.winfo_rootx()
             master_y = self.master.winfo_rooty()
             master_width = self.master.winfo_width()
             master_height = self.master.winfo_height()
-            win_width = self.winfo_width()
-            win_height = self.winfo_height()
             x = master_x + (master_width - win_width) // 2
             y = master_y + (master_height - win_height) // 2
-            self.geometry(f"+{x}+{y}")
+            self.geometry(f"{win_width}x{win_height}+{x}+{y}")
         self.deiconify()
 
 class ProfileWindow(CenteredToplevel):
-    def __init__(self, master, profile_type, profile=None, settings=None):
-        super().__init__(master)
+    _PRINTER_FIELDS = (
+        ("Printer Name:", "name"),
+        ("Power (W):", "power"),
+        ("Amortization (price/hour):", "amortization")
+    )
+    _PLASTIC_FIELDS = (
+        ("Plastic Name:", "name"),
+        ("Plastic Cost (price/kg):", "plastic_cost")
+    )
+
+    def __init__(self, master, profile_type, settings=None):
+        super().__init__(master, width=350, height=180)
         self.profile_type = profile_type
-        self.profile = profile
+        self.profile = None
         self.settings = settings
         self.result_profile = None
 
-        self.title(f"{'Edit' if profile else 'Create'} {profile_type.capitalize()} Profile")
-        self.geometry("350x180")
         self.resizable(False, False)
 
         self._create_widgets()
+
+    def open(self, profile=None):
+        """Show the dialog for creating (no profile) or editing a profile.
+
+        Blocks until the dialog is closed; result_profile then holds the
+        saved profile, or None if it was cancelled.
+        """
+        self.profile = profile
+        self.result_profile = None
+        self.title(f"{'Edit' if profile else 'Create'} {self.profile_type.capitalize()} Profile")
         self._populate_fields()
+        self.show()
 
     def _create_widgets(self):
         frm = ttk.Frame(self)
         frm.pack(padx=15, pady=15, fill="both", expand=True)
 
-        if self.profile_type == "printer":
-            labels = [
-                ("Printer Name:", "name"),
-                ("Power (W):", "power"),
-                ("Amortization (price/hour):", "amortization")
-            ]
-        else:
-            labels = [
-                ("Plastic Name:", "name"),
-                ("Plastic Cost (price/kg):", "plastic_cost")
-            ]
+        labels = self._PRINTER_FIELDS if self.profile_type == "printer" else self._PLASTIC_FIELDS
 
-        self.entries = {}
+        Label, Entry = ttk.Label, ttk.Entry
+        vcmd = (self.register(_is_numeric), "%P")
+        entries = self.entries = {}
         for i, (label_text, key) in enumerate(labels):
-            lbl = ttk.Label(frm, text=label_text)
+            lbl = Label(frm, text=label_text)
             lbl.grid(row=i, column=0, sticky="w", pady=5)
-            ent = ttk.Entry(frm)
+            if key == "name":
+                ent = Entry(frm, width=24)
+            else:
+                ent = Entry(frm, width=24, validate="key", validatecommand=vcmd)
             ent.grid(row=i, column=1, sticky="ew", pady=5)
-            self.entries[key] = ent
+            entries[key] = ent
         frm.columnconfigure(1, weight=1)
 
         btn_frame = ttk.Frame(self)
@@ -220,26 +559,25 @@ class ProfileWindow(CenteredToplevel):
 
         btn_save = ttk.Button(btn_frame, text="Save", command=self._on_save)
         btn_save.pack(side="right", padx=5)
-        btn_cancel = ttk.Button(btn_frame, text="Cancel", command=self.destroy)
+        btn_cancel = ttk.Button(btn_frame, text="Cancel", command=self.close)
         btn_cancel.pack(side="right")
 
     def _populate_fields(self):
-        if self.profile:
-            if self.profile_type == "printer":
-                self.entries["name"].insert(0, self.profile.name)
-                self.entries["power"].insert(0, str(self.profile.power))
-                self.entries["amortization"].insert(0, str(self.profile.amortization))
+        e = self.entries
+        p = self.profile
+        for ent in e.values():
+            ent.delete(0, tk.END)
+        if self.profile_type == "printer":
+            if p:
+                values = (("name", p.name), ("power", p.power), ("amortization", p.amortization))
             else:
-                self.entries["name"].insert(0, self.profile.name)
-                self.entries["plastic_cost"].insert(0, str(self.profile.plastic_cost))
+                values = (("power", 0), ("amortization", 0))
+        elif p:
+            values = (("name", p.name), ("plastic_cost", p.plastic_cost))
         else:
-            if self.profile_type == "printer":
-                self.entries["name"].insert(0, "")
-                self.entries["power"].insert(0, "0")
-                self.entries["amortization"].insert(0, "0")
-            else:
-                self.entries["name"].insert(0, "")
-                self.entries["plastic_cost"].insert(0, "0")
+            values = (("plastic_cost", 0),)
+        for key, value in values:
+            e[key].insert(0, str(value))
 
     def _on_save(self):
         name = self.entries["name"].get().strip()
@@ -248,44 +586,49 @@ class ProfileWindow(CenteredToplevel):
             return
         try:
             if self.profile_type == "printer":
-                power = float(self.entries["power"].get().replace(",", "."))
-                amortization = float(self.entries["amortization"].get().replace(",", "."))
+                power = _to_float(self.entries["power"].get())
+                amortization = _to_float(self.entries["amortization"].get())
                 self.result_profile = PrinterProfile(name, power, amortization)
             else:
-                plastic_cost = float(self.entries["plastic_cost"].get().replace(",", "."))
+                plastic_cost = _to_float(self.entries["plastic_cost"].get())
                 self.result_profile = PlasticProfile(name, plastic_cost)
         except ValueError:
             messagebox.showerror("Error", "Invalid numeric values.")
             return
-        self.destroy()
+        self.close()
 
 class SettingsWindow(CenteredToplevel):
+    _FIELDS = (
+        ("Electricity Cost (price/kWh):", "electricity_cost_default"),
+        ("Margin (%):", "margin_default")
+    )
+
     def __init__(self, master, settings):
-        super().__init__(master)
+        super().__init__(master, width=450, height=180)
         self.settings = settings
         self.title("Default Settings")
-        self.geometry("450x180")
         self.resizable(False, False)
 
         self._create_widgets()
+
+    def open(self):
+        """Show the dialog with the current settings; blocks until closed"""
         self._populate_fields()
+        self.show()
 
     def _create_widgets(self):
         frm = ttk.Frame(self)
         frm.pack(padx=15, pady=15, fill="both", expand=True)
 
-        labels = [
-            ("Electricity Cost (price/kWh):", "electricity_cost_default"),
-            ("Margin (%):", "margin_default")
-        ]
-
-        self.entries = {}
-        for i, (label_text, key) in enumerate(labels):
-            lbl = ttk.Label(frm, text=label_text)
+        Label, Entry = ttk.Label, ttk.Entry
+        vcmd = (self.register(_is_numeric), "%P")
+        entries = self.entries = {}
+        for i, (label_text, key) in enumerate(self._FIELDS):
+            lbl = Label(frm, text=label_text)
             lbl.grid(row=i, column=0, sticky="w", pady=5)
-            ent = ttk.Entry(frm)
+            ent = Entry(frm, width=24, validate="key", validatecommand=vcmd)
             ent.grid(row=i, column=1, sticky="ew", pady=5)
-            self.entries[key] = ent
+            entries[key] = ent
         frm.columnconfigure(1, weight=1)
 
         btn_frame = ttk.Frame(self)
@@ -293,36 +636,50 @@ class SettingsWindow(CenteredToplevel):
 
         btn_save = ttk.Button(btn_frame, text="Save", command=self._on_save)
         btn_save.pack(side="right", padx=5)
-        btn_cancel = ttk.Button(btn_frame, text="Cancel", command=self.destroy)
+        btn_cancel = ttk.Button(btn_frame, text="Cancel", command=self.close)
         btn_cancel.pack(side="right")
 
     def _populate_fields(self):
-        self.entries["electricity_cost_default"].delete(0, tk.END)
-        self.entries["electricity_cost_default"].insert(0, str(self.settings.electricity_cost_default))
-
-        self.entries["margin_default"].delete(0, tk.END)
-        self.entries["margin_default"].insert(0, str(self.settings.margin_default))
+        e = self.entries
+        st = self.settings
+        e["electricity_cost_default"].delete(0, tk.END)
+        e["margin_default"].delete(0, tk.END)
+        e["electricity_cost_default"].insert(0, str(st.electricity_cost_default))
+        e["margin_default"].insert(0, str(st.margin_default))
 
     def _on_save(self):
         try:
-            electricity_cost = float(self.entries["electricity_cost_default"].get().replace(",", ".").strip())
-            margin = float(self.entries["margin_default"].get().replace(",", ".").strip())
+            electricity_cost = _to_float(self.entries["electricity_cost_default"].get())
+            margin = _to_float(self.entries["margin_default"].get())
         except ValueError:
             messagebox.showerror("Error", "Please enter valid numeric values.")
             return
 
         self.settings.electricity_cost_default = electricity_cost
         self.settings.margin_default = margin
-        self.destroy()
+        self.close()
 
 def custom_round(value: float) -> int:
-    remainder = value % 100
-    base = value - remainder
-    # Round to 50 if remainder < 25, else to 100
-    if remainder < 25:
-        return int(base + 50)
-    else:
-        return int(base + 100)
+    # Round to 50 if remainder < 25, else to 100. Working on floor(value)
+    # keeps the result identical to float modulo, negatives included.
+    iv = math.floor(value)
+    remainder = iv % 100
+    return iv - remainder + 50 + 50 * (remainder >= 25)
+
+RESULT_TEMPLATE = (
+    "Calculation Results:\n"
+    "Printer: {printer}\n"
+    "Plastic: {plastic}\n\n"
+    "Weight: {weight} g\n"
+    "Print Time: {time} h\n"
+    "Additional Costs: {extra}\n\n"
+    "Amortization Cost: {amort:.2f}\n"
+    "Electricity Cost: {elec:.2f}\n"
+    "Plastic Cost: {plastic_cost:.2f}\n"
+    "Base Price (sum): {base_price:.2f}\n"
+    "Price with Margin ({margin}%): {price_with_margin:.2f}\n"
+    "Final Price (rounded): {final_price}\n"
+)
 
 class App(tk.Tk):
     def __init__(self):
@@ -340,14 +697,36 @@ class App(tk.Tk):
         if not config_loaded:
             self._setup_initial_config()
 
-        self.printers = []
-        self.plastics = []
+        self.printers = ProfileList(PrinterProfile.from_dict)
+        self.plastics = ProfileList(PlasticProfile.from_dict)
+        self._profiles_loaded = False
 
         self.current_printer = None
         self.current_plastic = None
 
+        # Values last pushed to each combobox
+        self._combo_values = {}
+
+        # Dialogs are built on first use, then hidden and reused
+        self._profile_windows = {}
+        self._settings_window = None
+
+        # Profile/selection changes are written after a short delay so that
+        # bursts of edits end up as a single write
+        self._profiles_dirty = False
+        self._flush_job = None
+
+        # Config writes run on a background thread. The queue holds at most
+        # one snapshot; a newer one replaces it if it hasn't been written yet.
+        self._write_q = queue.Queue(maxsize=1)
+        self._write_error = None
+        self._watch_job = None
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
         self._create_widgets()
-        self._load_profiles()
+        # Fill the profile combos once the window is up, not before first paint
+        self.after_idle(self._load_profiles)
         self._apply_defaults_to_inputs()
         
         # Register cleanup on window close
@@ -358,7 +737,7 @@ class App(tk.Tk):
         try:
             if self.settings.ensure_config_dir_exists():
                 # Create initial config file
-                self.settings.save([], [])
+                self.settings.save()
                 messagebox.showinfo("First Run Setup", 
                                   f"Configuration folder created at:\n{self.settings.config_dir}")
             else:
@@ -414,10 +793,12 @@ class App(tk.Tk):
         frame_defaults = ttk.LabelFrame(self, text="Default Settings (Read Only)")
         frame_defaults.pack(padx=10, pady=10, fill="x")
 
-        self.label_elec_cost = ttk.Label(frame_defaults, text=f"Electricity Cost (price/kWh): {self.settings.electricity_cost_default}")
+        self._last_elec_label = self.settings.electricity_cost_default
+        self.label_elec_cost = ttk.Label(frame_defaults, text=f"Electricity Cost (price/kWh): {self._last_elec_label}")
         self.label_elec_cost.pack(anchor="w", padx=10, pady=2)
 
-        self.label_margin = ttk.Label(frame_defaults, text=f"Margin (%): {self.settings.margin_default}")
+        self._last_margin_label = self.settings.margin_default
+        self.label_margin = ttk.Label(frame_defaults, text=f"Margin (%): {self._last_margin_label}")
         self.label_margin.pack(anchor="w", padx=10, pady=2)
 
         self.label_config_path = ttk.Label(frame_defaults, text=f"Config Path: {self.settings.config_dir}")
@@ -435,10 +816,11 @@ class App(tk.Tk):
             ("Additional Costs (price):", "extra")
         ]
 
+        vcmd = (self.register(_is_numeric), "%P")
         for i, (label_text, key) in enumerate(input_labels):
             lbl = ttk.Label(frame_input, text=label_text)
             lbl.grid(row=i, column=0, sticky="w", padx=5, pady=5)
-            ent = ttk.Entry(frame_input)
+            ent = ttk.Entry(frame_input, validate="key", validatecommand=vcmd)
             ent.grid(row=i, column=1, sticky="ew", padx=5, pady=5)
             self.entries_input[key] = ent
         frame_input.columnconfigure(1, weight=1)
@@ -456,18 +838,109 @@ class App(tk.Tk):
         frame_result = ttk.LabelFrame(self, text="Results")
         frame_result.pack(padx=10, pady=10, fill="both", expand=True)
 
-        self.result_text = tk.Text(frame_result, height=15, state="disabled")
+        # No insert cursor and skipped by Tab traversal, like a read-only view
+        self.result_text = tk.Text(frame_result, height=15, insertontime=0, takefocus=0)
         self.result_text.pack(fill="both", expand=True, padx=5, pady=5)
+        # Read-only without toggling state="disabled" on every update: only
+        # editing keys and events are swallowed, so every platform's copy,
+        # select and navigation shortcuts still reach the class bindings
+        self.result_text.bind("<Key>", self._on_result_key)
+        for sequence in self._RESULT_EDIT_SEQUENCES:
+            self.result_text.bind(sequence, lambda e: "break")
+
+    # Keys that edit the text whatever modifiers are held
+    _RESULT_EDIT_KEYS = frozenset(("BackSpace", "Delete", "Return", "KP_Enter", "Tab"))
+    # Edit virtual events and the emacs-style editing shortcuts of the Text class
+    _RESULT_EDIT_SEQUENCES = (
+        "<<Paste>>", "<<PasteSelection>>", "<<Cut>>", "<<Clear>>", "<<Undo>>", "<<Redo>>",
+        "<Control-h>", "<Control-d>", "<Control-k>", "<Control-o>", "<Control-t>",
+        "<Control-i>", "<Meta-d>", "<Meta-BackSpace>", "<Meta-Delete>",
+    )
+    # Control, and Mod1 (Command on macOS, Alt on X11), plus Alt on Windows
+    _SHORTCUT_STATE = 0x4 | 0x8 | 0x20000
+
+    def _on_result_key(self, event):
+        """Swallow keys that would edit the result text, let everything else through"""
+        if event.keysym in self._RESULT_EDIT_KEYS:
+            if event.keysym == "Tab" and event.state & 0x4:
+                return None  # Control-Tab moves the focus on
+            return "break"
+        if event.char and event.char.isprintable() and not event.state & self._SHORTCUT_STATE:
+            return "break"
+        return None
 
     def _load_profiles(self):
-        self.printers, self.plastics = self.settings.load_profiles()
+        """Load profiles into the combos; does nothing once they are loaded"""
+        if self._profiles_loaded:
+            return
+        self._profiles_loaded = True
+        printers, plastics = self.settings.load_profiles()
+        self.printers = ProfileList(PrinterProfile.from_dict, printers)
+        self.plastics = ProfileList(PlasticProfile.from_dict, plastics)
         self._refresh_printer_combo()
         self._refresh_plastic_combo()
 
     def _save_profiles(self):
+        # A direct save supersedes any pending deferred one
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        self._profiles_dirty = False
+        # Never write the config before its profiles have been read back
+        self._load_profiles()
         # Update the last selected profiles before saving
         self._update_last_selected()
-        self.settings.save(self.printers, self.plastics)
+        self._enqueue_save(self.settings.build_data(self.printers, self.plastics))
+
+    def _enqueue_save(self, data):
+        """Hand a config snapshot to the writer thread"""
+        try:
+            # Drop a snapshot that hasn't been written yet, this one supersedes it
+            self._write_q.get_nowait()
+            self._write_q.task_done()
+        except queue.Empty:
+            pass
+        self._write_q.put_nowait(data)
+        if self._watch_job is None:
+            self._watch_job = self.after(100, self._watch_writer)
+
+    def _writer_loop(self):
+        """Writer thread: save queued snapshots until a None sentinel arrives"""
+        while True:
+            data = self._write_q.get()
+            try:
+                if data is None:
+                    return
+                self.settings.write(data)
+            except Exception as e:
+                self._write_error = e
+            finally:
+                self._write_q.task_done()
+
+    def _watch_writer(self):
+        """Poll until queued writes are done, then report any failure"""
+        if self._write_q.unfinished_tasks:
+            self._watch_job = self.after(100, self._watch_writer)
+            return
+        self._watch_job = None
+        self._report_write_error()
+
+    def _report_write_error(self):
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            messagebox.showerror("Error", f"Failed to save configuration:\n{error}")
+
+    def _mark_profiles_dirty(self):
+        """Schedule a save, restarting the delay if one is already pending"""
+        self._profiles_dirty = True
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+        self._flush_job = self.after(500, self._flush_profiles)
+
+    def _flush_profiles(self):
+        self._flush_job = None
+        if self._profiles_dirty:
+            self._save_profiles()
 
     def _update_last_selected(self):
         """Update the last selected printer and plastic in settings"""
@@ -476,46 +949,60 @@ class App(tk.Tk):
         if self.current_plastic:
             self.settings.last_selected_plastic = self.current_plastic.name
 
+    def _set_combo_values(self, combo, names):
+        """Give a combobox its values, skipping the Tk call if they are unchanged"""
+        names = tuple(names)
+        if self._combo_values.get(combo) != names:
+            combo.configure(values=names)
+            self._combo_values[combo] = names
+
     def _refresh_printer_combo(self):
-        names = [p.name for p in self.printers]
-        self.printer_combo["values"] = names
-        
-        # Try to restore last selected printer
-        if names:
-            selected_idx = 0
-            if self.settings.last_selected_printer:
-                try:
-                    selected_idx = names.index(self.settings.last_selected_printer)
-                except ValueError:
-                    # If last selected printer no longer exists, use first one
-                    selected_idx = 0
-            
-            self.printer_combo.current(selected_idx)
-            self._on_printer_selected()
+        """Reload the combobox and select the last selected printer, or the first
+        one if that name no longer exists"""
+        self._sync_printer_combo(self.printers.index(self.settings.last_selected_printer, 0))
+
+    def _sync_printer_combo(self, select_idx):
+        """Update the combobox values and select the entry at select_idx.
+
+        Used directly after a create/edit/delete, where the index is known,
+        and by _refresh_printer_combo.
+        """
+        self._set_combo_values(self.printer_combo, self.printers.names)
+        if self.printers:
+            self.printer_combo.current(select_idx)
+            self.current_printer = self.printers[select_idx]
         else:
             self.printer_combo.set("")
             self.current_printer = None
 
     def _on_printer_selected(self, event=None):
+        # By position, since the config may hold several profiles with one name
         idx = self.printer_combo.current()
         if 0 <= idx < len(self.printers):
             self.current_printer = self.printers[idx]
-            # Save selection immediately when changed by user
+            # Save selection when changed by user
             if event is not None:  # Only save if triggered by user interaction
-                self._save_profiles()
+                if self.settings.last_selected_printer == self.current_printer.name:
+                    return
+                self._mark_profiles_dirty()
+
+    def _get_profile_window(self, profile_type):
+        wnd = self._profile_windows.get(profile_type)
+        if wnd is None:
+            wnd = ProfileWindow(self, profile_type, settings=self.settings)
+            self._profile_windows[profile_type] = wnd
+        return wnd
 
     def _create_printer(self):
-        wnd = ProfileWindow(self, "printer", settings=self.settings)
-        self.wait_window(wnd)
+        wnd = self._get_profile_window("printer")
+        wnd.open()
         if wnd.result_profile:
-            if any(p.name == wnd.result_profile.name for p in self.printers):
+            if wnd.result_profile.name in self.printers:
                 messagebox.showerror("Error", "Profile with this name already exists.")
                 return
             self.printers.append(wnd.result_profile)
-            self._save_profiles()
-            self._refresh_printer_combo()
-            self.printer_combo.set(wnd.result_profile.name)
-            self._on_printer_selected()
+            self._mark_profiles_dirty()
+            self._sync_printer_combo(len(self.printers) - 1)
 
     def _edit_printer(self):
         idx = self.printer_combo.current()
@@ -523,18 +1010,17 @@ class App(tk.Tk):
             messagebox.showwarning("Warning", "No printer selected.")
             return
         profile = self.printers[idx]
-        wnd = ProfileWindow(self, "printer", profile, settings=self.settings)
-        self.wait_window(wnd)
+        wnd = self._get_profile_window("printer")
+        wnd.open(profile)
         if wnd.result_profile:
             # Check for duplicate names except for the edited profile itself
-            if any(p.name == wnd.result_profile.name and p != profile for p in self.printers):
+            new_name = wnd.result_profile.name
+            if new_name != profile.name and new_name in self.printers:
                 messagebox.showerror("Error", "Profile with this name already exists.")
                 return
             self.printers[idx] = wnd.result_profile
-            self._save_profiles()
-            self._refresh_printer_combo()
-            self.printer_combo.set(wnd.result_profile.name)
-            self._on_printer_selected()
+            self._mark_profiles_dirty()
+            self._sync_printer_combo(idx)
 
     def _delete_printer(self):
         idx = self.printer_combo.current()
@@ -547,49 +1033,49 @@ class App(tk.Tk):
             # Clear last selected if it was the deleted one
             if self.current_printer and self.current_printer.name == self.settings.last_selected_printer:
                 self.settings.last_selected_printer = ""
-            self._save_profiles()
-            self._refresh_printer_combo()
+            self._mark_profiles_dirty()
+            self._sync_printer_combo(0)
 
     def _refresh_plastic_combo(self):
-        names = [p.name for p in self.plastics]
-        self.plastic_combo["values"] = names
-        
-        # Try to restore last selected plastic
-        if names:
-            selected_idx = 0
-            if self.settings.last_selected_plastic:
-                try:
-                    selected_idx = names.index(self.settings.last_selected_plastic)
-                except ValueError:
-                    # If last selected plastic no longer exists, use first one
-                    selected_idx = 0
-            
-            self.plastic_combo.current(selected_idx)
-            self._on_plastic_selected()
+        """Reload the combobox and select the last selected plastic, or the first
+        one if that name no longer exists"""
+        self._sync_plastic_combo(self.plastics.index(self.settings.last_selected_plastic, 0))
+
+    def _sync_plastic_combo(self, select_idx):
+        """Update the combobox values and select the entry at select_idx.
+
+        Used directly after a create/edit/delete, where the index is known,
+        and by _refresh_plastic_combo.
+        """
+        self._set_combo_values(self.plastic_combo, self.plastics.names)
+        if self.plastics:
+            self.plastic_combo.current(select_idx)
+            self.current_plastic = self.plastics[select_idx]
         else:
             self.plastic_combo.set("")
             self.current_plastic = None
 
     def _on_plastic_selected(self, event=None):
+        # By position, since the config may hold several profiles with one name
         idx = self.plastic_combo.current()
         if 0 <= idx < len(self.plastics):
             self.current_plastic = self.plastics[idx]
-            # Save selection immediately when changed by user
+            # Save selection when changed by user
             if event is not None:  # Only save if triggered by user interaction
-                self._save_profiles()
+                if self.settings.last_selected_plastic == self.current_plastic.name:
+                    return
+                self._mark_profiles_dirty()
 
     def _create_plastic(self):
-        wnd = ProfileWindow(self, "plastic", settings=self.settings)
-        self.wait_window(wnd)
+        wnd = self._get_profile_window("plastic")
+        wnd.open()
         if wnd.result_profile:
-            if any(p.name == wnd.result_profile.name for p in self.plastics):
+            if wnd.result_profile.name in self.plastics:
                 messagebox.showerror("Error", "Profile with this name already exists.")
                 return
             self.plastics.append(wnd.result_profile)
-            self._save_profiles()
-            self._refresh_plastic_combo()
-            self.plastic_combo.set(wnd.result_profile.name)
-            self._on_plastic_selected()
+            self._mark_profiles_dirty()
+            self._sync_plastic_combo(len(self.plastics) - 1)
 
     def _edit_plastic(self):
         idx = self.plastic_combo.current()
@@ -597,17 +1083,16 @@ class App(tk.Tk):
             messagebox.showwarning("Warning", "No plastic selected.")
             return
         profile = self.plastics[idx]
-        wnd = ProfileWindow(self, "plastic", profile, settings=self.settings)
-        self.wait_window(wnd)
+        wnd = self._get_profile_window("plastic")
+        wnd.open(profile)
         if wnd.result_profile:
-            if any(p.name == wnd.result_profile.name and p != profile for p in self.plastics):
+            new_name = wnd.result_profile.name
+            if new_name != profile.name and new_name in self.plastics:
                 messagebox.showerror("Error", "Profile with this name already exists.")
                 return
             self.plastics[idx] = wnd.result_profile
-            self._save_profiles()
-            self._refresh_plastic_combo()
-            self.plastic_combo.set(wnd.result_profile.name)
-            self._on_plastic_selected()
+            self._mark_profiles_dirty()
+            self._sync_plastic_combo(idx)
 
     def _delete_plastic(self):
         idx = self.plastic_combo.current()
@@ -620,8 +1105,8 @@ class App(tk.Tk):
             # Clear last selected if it was the deleted one
             if self.current_plastic and self.current_plastic.name == self.settings.last_selected_plastic:
                 self.settings.last_selected_plastic = ""
-            self._save_profiles()
-            self._refresh_plastic_combo()
+            self._mark_profiles_dirty()
+            self._sync_plastic_combo(0)
 
     def _apply_defaults_to_inputs(self):
         # You can insert here if you want to populate input fields with default values
@@ -634,58 +1119,75 @@ class App(tk.Tk):
         if self.current_plastic is None:
             messagebox.showwarning("Warning", "Select a plastic profile first.")
             return
+        e = self.entries_input
         try:
-            weight = float(self.entries_input["weight"].get().replace(",", "."))
-            time = float(self.entries_input["time"].get().replace(",", "."))
-            extra = float(self.entries_input["extra"].get().replace(",", "."))
+            weight = _to_float(e["weight"].get())
+            time = _to_float(e["time"].get())
+            extra = _to_float(e["extra"].get())
         except ValueError:
             messagebox.showerror("Error", "Invalid numeric input.")
             return
 
+        pr = self.current_printer
+        pl = self.current_plastic
+        st = self.settings
+
         # Calculations
-        power_kw = self.current_printer.power / 1000.0
-        elec_cost = self.settings.electricity_cost_default
-        margin = self.settings.margin_default / 100.0
+        power_kw = pr.power * 0.001
+        elec_cost = st.electricity_cost_default
 
-        amort = self.current_printer.amortization * time
+        amort = pr.amortization * time
         elec = power_kw * time * elec_cost
-        plastic_cost = (weight / 1000.0) * self.current_plastic.plastic_cost
+        plastic_cost = weight * 0.001 * pl.plastic_cost
         base_price = amort + elec + plastic_cost + extra
-        price_with_margin = base_price * (1 + margin)
+        price_with_margin = base_price * st.margin_multiplier
 
         if self.round_var.get():
             final_price = custom_round(price_with_margin)
         else:
             final_price = round(price_with_margin, 2)
 
-        result = (
-            f"Calculation Results:\n"
-            f"Printer: {self.current_printer.name}\n"
-            f"Plastic: {self.current_plastic.name}\n\n"
-            f"Weight: {weight} g\n"
-            f"Print Time: {time} h\n"
-            f"Additional Costs: {extra}\n\n"
-            f"Amortization Cost: {amort:.2f}\n"
-            f"Electricity Cost: {elec:.2f}\n"
-            f"Plastic Cost: {plastic_cost:.2f}\n"
-            f"Base Price (sum): {base_price:.2f}\n"
-            f"Price with Margin ({self.settings.margin_default}%): {price_with_margin:.2f}\n"
-            f"Final Price (rounded): {final_price}\n"
-        )
-        self.result_text.config(state="normal")
-        self.result_text.delete("1.0", tk.END)
-        self.result_text.insert(tk.END, result)
-        self.result_text.config(state="disabled")
+        result = RESULT_TEMPLATE.format_map({
+            "printer": pr.name,
+            "plastic": pl.name,
+            "weight": weight,
+            "time": time,
+            "extra": extra,
+            "amort": amort,
+            "elec": elec,
+            "plastic_cost": plastic_cost,
+            "base_price": base_price,
+            "margin": st.margin_default,
+            "price_with_margin": price_with_margin,
+            "final_price": final_price,
+        })
+        try:
+            self.result_text.replace("1.0", tk.END, result)
+        except tk.TclError:
+            # "replace" needs Tk 8.6+
+            self.result_text.delete("1.0", tk.END)
+            self.result_text.insert(tk.END, result)
 
     def _open_settings(self):
-        wnd = SettingsWindow(self, self.settings)
-        self.wait_window(wnd)
+        if self._settings_window is None:
+            self._settings_window = SettingsWindow(self, self.settings)
+        self._settings_window.open()
         # Save the updated settings
         self._save_profiles()  # This will save with new settings
         
         # Update labels after settings change
-        self.label_elec_cost.config(text=f"Electricity Cost (price/kWh): {self.settings.electricity_cost_default}")
-        self.label_margin.config(text=f"Margin (%): {self.settings.margin_default}")
+        self._update_settings_labels()
+
+    def _update_settings_labels(self):
+        """Show the current default settings, touching only labels whose value changed"""
+        elec_cost = self.settings.electricity_cost_default
+        if elec_cost != self._last_elec_label:
+            self.label_elec_cost.config(text=f"Electricity Cost (price/kWh): {elec_cost}")
+            self._last_elec_label = elec_cost
+        margin = self.settings.margin_default
+        if margin != self._last_margin_label:
+            self.label_margin.config(text=f"Margin (%): {margin}")
+            self._last_margin_label = margin
 
     def _import_config(self):
         path = filedialog.askopenfilename(
@@ -695,41 +1197,41 @@ class App(tk.Tk):
         )
         if not path:
             return
+        self._load_profiles()
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            # Load settings
+            with open(path, "rb") as f:
+                data = _loads(f.read())
+
+            # Read and build everything first, so a bad entry fails the
+            # import without leaving it half applied
+            st = self.settings
+            electricity_cost = st.electricity_cost_default
+            margin = st.margin_default
             if "electricity_cost_default" in data:
-                self.settings.electricity_cost_default = float(data["electricity_cost_default"])
+                electricity_cost = _finite_float(data["electricity_cost_default"])
             if "margin_default" in data:
-                self.settings.margin_default = float(data["margin_default"])
-            
+                margin = _finite_float(data["margin_default"])
+            # Only profiles whose names aren't taken yet are added
+            new_printers = self.printers.new_profiles(data.get("printers", []))
+            new_plastics = self.plastics.new_profiles(data.get("plastics", []))
+
+            st.electricity_cost_default = electricity_cost
+            st.margin_default = margin
             # Load last selected profiles if they exist
             if "last_selected_printer" in data:
-                self.settings.last_selected_printer = data["last_selected_printer"]
+                st.last_selected_printer = data["last_selected_printer"]
             if "last_selected_plastic" in data:
-                self.settings.last_selected_plastic = data["last_selected_plastic"]
-            
-            # Load profiles
-            imported_printers = [PrinterProfile.from_dict(d) for d in data.get("printers", [])]
-            imported_plastics = [PlasticProfile.from_dict(d) for d in data.get("plastics", [])]
-
-            # Add profiles if no duplicates exist
-            for p in imported_printers:
-                if not any(existing.name == p.name for existing in self.printers):
-                    self.printers.append(p)
-            for p in imported_plastics:
-                if not any(existing.name == p.name for existing in self.plastics):
-                    self.plastics.append(p)
+                st.last_selected_plastic = data["last_selected_plastic"]
+            self.printers.extend(new_printers)
+            self.plastics.extend(new_plastics)
 
-            self._save_profiles()
+            # Refresh and save once, after all profiles are merged
             self._refresh_printer_combo()
             self._refresh_plastic_combo()
+            self._save_profiles()
             
             # Update UI labels
-            self.label_elec_cost.config(text=f"Electricity Cost (price/kWh): {self.settings.electricity_cost_default}")
-            self.label_margin.config(text=f"Margin (%): {self.settings.margin_default}")
+            self._update_settings_labels()
             
             messagebox.showinfo("Import", "Configuration imported successfully.")
         except Exception as e:
@@ -744,6 +1246,7 @@ class App(tk.Tk):
         )
         if not path:
             return
+        self._load_profiles()
         try:
             # Ensure the directory exists before saving
             os.makedirs(os.path.dirname(path), exist_ok=True)
@@ -754,19 +1257,28 @@ class App(tk.Tk):
                 "margin_default": self.settings.margin_default,
                 "last_selected_printer": self.settings.last_selected_printer,
                 "last_selected_plastic": self.settings.last_selected_plastic,
-                "printers": [p.to_dict() for p in self.printers],
-                "plastics": [p.to_dict() for p in self.plastics]
+                "printers": self.printers.to_dicts(),
+                "plastics": self.plastics.to_dicts()
             }
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            # A plain write: no temp file in the user's folder, and an
+            # existing file keeps its permissions
+            with open(path, "wb") as f:
+                f.write(_dumps_pretty(data))
             messagebox.showinfo("Export", "Configuration exported successfully.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export configuration:\n{e}")
 
     def _on_closing(self):
         """Called when the application is closing"""
-        # Save the current selections before closing
+        # Save the current selections (and any pending changes) before closing
         self._save_profiles()
+        if self._watch_job is not None:
+            self.after_cancel(self._watch_job)
+            self._watch_job = None
+        # Let the writer finish pending saves, then stop it
+        self._write_q.put(None)
+        self._writer.join()
+        self._report_write_error()
         self.destroy()
 
 if __name__ == "__main__":